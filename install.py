@@ -9,33 +9,53 @@ Usage:
     python install.py --force   # Overwrite existing files without prompting
     python install.py --check   # Check installation status only
     python install.py --mcp     # Configure MCP search servers interactively
+    python install.py --quiet   # Install without the MCP prompt or usage help
 """
 
+import functools
+import importlib
+import importlib.util
 import json
 import os
-import platform
 import shutil
-import subprocess
 import sys
+from enum import IntEnum
 from pathlib import Path
 
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
 
-# Installation paths
+# ioctl request for reflink clones; only exported by fcntl on 3.12+, and the
+# fallback number is only meaningful to a Linux kernel.
+FICLONE = getattr(fcntl, "FICLONE", 0x40049409) if sys.platform.startswith("linux") else None
+
+# Larger chunks for shutil's read/write copy loop (64 KiB on POSIX, 1 MiB on
+# Windows by default), so big files take fewer syscalls to copy.
+shutil.COPY_BUFSIZE = 16 * 1024 * 1024
+
+
+# Installation paths (resolved once per process)
+@functools.lru_cache(maxsize=None)
 def get_claude_dir():
     """Get the .claude directory path."""
     return Path.home() / ".claude"
 
 
+@functools.lru_cache(maxsize=None)
 def get_skills_dir():
     """Get the skills installation directory."""
     return get_claude_dir() / "skills"
 
 
+@functools.lru_cache(maxsize=None)
 def get_agents_dir():
     """Get the agents installation directory."""
     return get_claude_dir() / "agents"
 
 
+@functools.lru_cache(maxsize=None)
 def get_settings_path():
     """Get the settings.json path."""
     return get_claude_dir() / "settings.json"
@@ -60,92 +80,189 @@ SKILL_DIRS = [
 SKILL_FILES = ["research/validate_json.py"]
 AGENT_FILES = ["web-search-agent.md"]
 
+
 # MCP Server configurations
-MCP_SERVERS = {
-    "tavily": {
-        "name": "Tavily",
-        "description": "Recommended for web search",
-        "url": "https://tavily.com/",
-        "env_var": "TAVILY_API_KEY",
-        "config": {
-            "command": "npx",
-            "args": ["-y", "tavily-mcp@latest"],
-            "env": {
-                "TAVILY_API_KEY": ""
+@functools.lru_cache(maxsize=None)
+def get_mcp_servers():
+    """Get the supported MCP server configurations."""
+    return {
+        "tavily": {
+            "name": "Tavily",
+            "description": "Recommended for web search",
+            "url": "https://tavily.com/",
+            "env_var": "TAVILY_API_KEY",
+            "config": {
+                "command": "npx",
+                "args": ["-y", "tavily-mcp@latest"],
+                "env": {
+                    "TAVILY_API_KEY": ""
+                }
             }
-        }
-    },
-    "brave-search": {
-        "name": "Brave Search",
-        "description": "Alternative web search",
-        "url": "https://brave.com/search/api/",
-        "env_var": "BRAVE_API_KEY",
-        "config": {
-            "command": "npx",
-            "args": ["-y", "@modelcontextprotocol/server-brave-search"],
-            "env": {
-                "BRAVE_API_KEY": ""
+        },
+        "brave-search": {
+            "name": "Brave Search",
+            "description": "Alternative web search",
+            "url": "https://brave.com/search/api/",
+            "env_var": "BRAVE_API_KEY",
+            "config": {
+                "command": "npx",
+                "args": ["-y", "@modelcontextprotocol/server-brave-search"],
+                "env": {
+                    "BRAVE_API_KEY": ""
+                }
             }
-        }
-    },
-    "perplexity": {
-        "name": "Perplexity",
-        "description": "Deep synthesis and research",
-        "url": "https://www.perplexity.ai/settings/api",
-        "env_var": "PERPLEXITY_API_KEY",
-        "config": {
-            "command": "npx",
-            "args": ["-y", "perplexity-mcp@latest"],
-            "env": {
-                "PERPLEXITY_API_KEY": ""
+        },
+        "perplexity": {
+            "name": "Perplexity",
+            "description": "Deep synthesis and research",
+            "url": "https://www.perplexity.ai/settings/api",
+            "env_var": "PERPLEXITY_API_KEY",
+            "config": {
+                "command": "npx",
+                "args": ["-y", "perplexity-mcp@latest"],
+                "env": {
+                    "PERPLEXITY_API_KEY": ""
+                }
             }
-        }
-    },
-    "firecrawl": {
-        "name": "Firecrawl",
-        "description": "Web scraping and crawling",
-        "url": "https://firecrawl.dev/",
-        "env_var": "FIRECRAWL_API_KEY",
-        "config": {
-            "command": "npx",
-            "args": ["-y", "firecrawl-mcp@latest"],
-            "env": {
-                "FIRECRAWL_API_KEY": ""
+        },
+        "firecrawl": {
+            "name": "Firecrawl",
+            "description": "Web scraping and crawling",
+            "url": "https://firecrawl.dev/",
+            "env_var": "FIRECRAWL_API_KEY",
+            "config": {
+                "command": "npx",
+                "args": ["-y", "firecrawl-mcp@latest"],
+                "env": {
+                    "FIRECRAWL_API_KEY": ""
+                }
             }
         }
     }
-}
 
 
-def print_header(text):
-    """Print a formatted header."""
-    print(f"\n{'='*60}")
-    print(f"  {text}")
-    print(f"{'='*60}")
+# Help text shown after a fresh install
+MCP_SETUP_TEXT = """
+  Web search requires at least one MCP search server.
+  You can configure this now or later with: python install.py --mcp
+"""
+
+USAGE_TEXT = """
+  Available commands:
+
+    /research <topic>           Generate research outline
+    /research-add-items         Add items to existing outline
+    /research-add-fields        Add fields to existing definitions
+    /research-deep              Execute deep research on outline
+    /research-report            Generate markdown report from results
+    /research-auto <topic>      Run complete research workflow
 
+  Autonomous mode (no prompts):
 
-def print_status(status, text):
-    """Print a status message."""
-    symbols = {"ok": "✓", "warn": "!", "error": "✗", "info": "→"}
-    symbol = symbols.get(status, "•")
-    print(f"  [{symbol}] {text}")
+    /research <topic> --auto
+    /research-auto <topic> --auto
 
+  Example:
 
+    /research-auto "AI chip market 2024-2025" --auto
+"""
+
+
+class Status(IntEnum):
+    """Status levels for print_status; each value indexes STATUS_SYMBOLS."""
+    OK = 0
+    WARN = 1
+    ERROR = 2
+    INFO = 3
+
+
+STATUS_SYMBOLS = ("✓", "!", "✗", "→")
+
+
+def flush_output(out):
+    """Write buffered output lines to stdout in a single call."""
+    if out:
+        sys.stdout.write("\n".join(out) + "\n")
+        out.clear()
+
+
+def print_header(text, out=None):
+    """Print a formatted header, or append it to an output buffer."""
+    line = "=" * 60
+    lines = ["", line, f"  {text}", line]
+    if out is None:
+        flush_output(lines)
+    else:
+        out.extend(lines)
+
+
+def print_status(status, text, out=None):
+    """Print a status message, or append it to an output buffer."""
+    line = f"  [{STATUS_SYMBOLS[status]}] {text}"
+    if out is None:
+        sys.stdout.write(line + "\n")
+    else:
+        out.append(line)
+
+
+@functools.lru_cache(maxsize=1)
 def check_pyyaml():
-    """Check if PyYAML is installed."""
+    """Check if PyYAML is installed.
+
+    Probes with find_spec first, so a missing PyYAML costs no failed import.
+    The result is cached; install_pyyaml clears it after installing.
+    """
+    if importlib.util.find_spec("yaml") is None:
+        return False, None
     try:
         import yaml
-        return True, yaml.__version__
     except ImportError:
         return False, None
+    return True, yaml.__version__
 
 
-def install_pyyaml():
-    """Attempt to install PyYAML."""
-    print_status("info", "Attempting to install PyYAML...")
+# pip arguments shared by the in-process and subprocess install paths
+PIP_INSTALL_ARGS = [
+    "install",
+    "--prefer-binary",
+    "--disable-pip-version-check",
+    "--no-input",
+    "--quiet",
+    "PyYAML",
+]
+
+
+def _install_with_uv():
+    """Install PyYAML into this interpreter with uv, if uv is available."""
+    import subprocess
+
+    uv = shutil.which("uv")
+    if uv is None:
+        return False
     try:
         subprocess.check_call(
-            [sys.executable, "-m", "pip", "install", "PyYAML"],
+            [uv, "pip", "install", "--python", sys.executable, "PyYAML"],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        return True
+    except (subprocess.CalledProcessError, OSError):
+        return False
+
+
+def _install_with_pip():
+    """Install PyYAML with pip, in-process when pip is importable."""
+    try:
+        from pip._internal.cli.main import main as pip_main
+    except ImportError:
+        pip_main = None
+    if pip_main is not None:
+        return pip_main(PIP_INSTALL_ARGS) == 0
+
+    import subprocess
+    try:
+        subprocess.check_call(
+            [sys.executable, "-m", "pip"] + PIP_INSTALL_ARGS,
             stdout=subprocess.DEVNULL,
             stderr=subprocess.DEVNULL,
         )
@@ -156,46 +273,306 @@ def install_pyyaml():
         return False
 
 
-def copy_directory(src, dst, force=False):
-    """Copy a directory, optionally overwriting."""
+def install_pyyaml():
+    """Attempt to install PyYAML.
+
+    Tries uv first, then pip in-process; a pip subprocess is only spawned
+    when pip cannot be imported here.
+    """
+    print_status(Status.INFO, "Attempting to install PyYAML...")
+    if not (_install_with_uv() or _install_with_pip()):
+        return False
+    # Let check_pyyaml see the freshly installed package
+    importlib.invalidate_caches()
+    check_pyyaml.cache_clear()
+    return True
+
+
+def _copyfile_compat(src, dst):
+    """Copy file contents with os.sendfile, or a reused 1 MiB buffer.
+
+    Python 3.8+ shutil.copyfile does this itself; older versions always copy
+    through a userspace read/write loop that allocates per chunk.
+    """
+    with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+        if hasattr(os, "sendfile"):
+            try:
+                size = os.fstat(fsrc.fileno()).st_size
+                offset = 0
+                while offset < size:
+                    sent = os.sendfile(fdst.fileno(), fsrc.fileno(), offset, size - offset)
+                    if sent == 0:
+                        break
+                    offset += sent
+                return dst
+            except OSError:
+                # e.g. macOS, where sendfile only writes to sockets
+                fsrc.seek(0)
+                fdst.seek(0)
+                fdst.truncate()
+        buf = bytearray(1024 * 1024)
+        view = memoryview(buf)
+        while True:
+            n = fsrc.readinto(buf)
+            if not n:
+                break
+            fdst.write(view[:n])
+    return dst
+
+
+copyfile = shutil.copyfile if sys.version_info >= (3, 8) else _copyfile_compat
+
+
+def _clone_file(src, dst):
+    """Reflink src to dst (btrfs, XFS); raises OSError where unsupported."""
+    if FICLONE is None:
+        raise OSError("reflinks are not supported on this platform")
+    with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+        fcntl.ioctl(fdst.fileno(), FICLONE, fsrc.fileno())
+
+
+def _link_or_copy(src, dst):
+    """Hardlink src to dst, falling back to a reflink, then a byte copy."""
+    try:
+        os.link(src, dst)
+        return
+    except OSError:
+        pass
+    try:
+        _clone_file(src, dst)
+        return
+    except OSError:
+        pass
+    # Installed skills are plain text; copyfile skips the metadata syscalls of
+    # copy2 and goes straight to the platform fast path (sendfile/CopyFile2).
+    copyfile(src, dst)
+
+
+def _fast_copytree(src, dst):
+    """Copy a directory tree, sharing file data with the source where possible.
+
+    Files are hardlinked when src and dst are on the same filesystem, so edits
+    to installed files show up in the source checkout (and vice versa). That
+    is fine for an installer whose source tree is the repo itself.
+    """
+    # Walk once, create the whole directory skeleton, then fill in files
+    tree = [
+        (root, os.path.join(dst, os.path.relpath(root, src)), files)
+        for root, _, files in os.walk(src)
+    ]
+    os.makedirs(dst)
+    for _, target, _ in tree[1:]:
+        os.mkdir(target)
+    for root, target, files in tree:
+        for name in files:
+            _link_or_copy(os.path.join(root, name), os.path.join(target, name))
+
+
+def _same_file(src, dst):
+    """Check whether two files have identical contents."""
+    import filecmp
+
+    try:
+        return os.path.samefile(src, dst) or filecmp.cmp(src, dst, shallow=False)
+    except OSError:
+        return False
+
+
+def _same_tree(src, dst):
+    """Check whether dst holds exactly the files of src, byte for byte."""
+    for root, dirs, files in os.walk(src):
+        target = os.path.join(dst, os.path.relpath(root, src))
+        if scan_dir(target).keys() != set(dirs) | set(files):
+            return False
+        for name in files:
+            if not _same_file(os.path.join(root, name), os.path.join(target, name)):
+                return False
+    return True
+
+
+def _temp_path(dst, tag="tmp"):
+    """Return a hidden sibling path of dst for staging a copy.
+
+    The leading dot keeps staged and retired trees from being picked up as
+    extra skills while they exist.
+    """
+    head, tail = os.path.split(dst)
+    return os.path.join(head, f".{tail}.{tag}.{os.getpid()}")
+
+
+def _remove_path(path):
+    """Remove a file, symlink or directory tree; a missing path is ignored."""
+    if os.path.isdir(path) and not os.path.islink(path):
+        shutil.rmtree(path)
+        return
+    try:
+        os.unlink(path)
+    except FileNotFoundError:
+        pass
+
+
+def _replace_tree(src, dst):
+    """Copy src into place at dst, swapping out any existing tree.
+
+    The new tree is built next to dst and renamed into place, so dst is
+    never left half-copied. If dst already exists it is moved aside first,
+    since a rename cannot replace a non-empty directory.
+    """
+    tmp = _temp_path(dst)
+    old = _temp_path(dst, "old")
+    # Leftovers from an interrupted run that had the same pid
+    _remove_path(tmp)
+    _remove_path(old)
+    try:
+        _fast_copytree(src, tmp)
+        if not os.path.lexists(dst):
+            os.replace(tmp, dst)
+            return
+        os.rename(dst, old)
+        try:
+            os.replace(tmp, dst)
+        except BaseException:
+            os.rename(old, dst)
+            raise
+    except BaseException:
+        shutil.rmtree(tmp, ignore_errors=True)
+        raise
+    # A symlinked skill dir is unlinked, never followed into its target
+    _remove_path(old)
+
+
+def _replace_file(src, dst):
+    """Copy src to a sibling temp file, then atomically rename it over dst."""
+    tmp = _temp_path(dst)
+    try:
+        copyfile(src, tmp)
+        os.replace(tmp, dst)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
+
+def _copy_keep(src, dst, is_dir):
+    """Copy src to dst, leaving an existing destination untouched."""
     if dst.exists():
-        if force:
-            shutil.rmtree(dst)
-        else:
-            return False, "exists"
-    shutil.copytree(src, dst)
+        return False, "exists"
+    (_replace_tree if is_dir else _replace_file)(src, dst)
     return True, "installed"
 
 
-def copy_file(src, dst, force=False):
-    """Copy a file, optionally overwriting."""
-    if dst.exists():
-        if force:
-            dst.unlink()
-        else:
-            return False, "exists"
-    shutil.copy2(src, dst)
+def _copy_force(src, dst, is_dir):
+    """Copy src over dst unless dst already has the same contents."""
+    if dst.exists() and (_same_tree if is_dir else _same_file)(src, dst):
+        return True, "unchanged"
+    (_replace_tree if is_dir else _replace_file)(src, dst)
     return True, "installed"
 
 
+def copy_task(copy, src, dst, is_dir):
+    """Copy a single skill or agent, reporting a missing source."""
+    if not src.exists():
+        return False, "missing"
+    return copy(src, dst, is_dir)
+
+
+def run_copy_tasks(tasks, force=False):
+    """Run (label, src, dst, is_dir) copy tasks concurrently.
+
+    Results are returned in task order so the report stays deterministic.
+    """
+    if not tasks:
+        return []
+    # force is fixed for the run, so pick the matching copy routine once
+    copy = _copy_force if force else _copy_keep
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=min(8, len(tasks))) as executor:
+        futures = [
+            executor.submit(copy_task, copy, src, dst, is_dir)
+            for _, src, dst, is_dir in tasks
+        ]
+        return [future.result() for future in futures]
+
+
+def report_copy_results(tasks, results, out=None):
+    """Report copy results and return (installed, skipped, unchanged) counts."""
+    installed = 0
+    skipped = 0
+    unchanged = 0
+    for (label, _, _, _), (_, status) in zip(tasks, results):
+        if status == "missing":
+            print_status(Status.ERROR, f"{label} (source not found)", out)
+        elif status == "unchanged":
+            print_status(Status.OK, f"{label} (unchanged)", out)
+            unchanged += 1
+        elif status == "installed":
+            print_status(Status.OK, label, out)
+            installed += 1
+        else:
+            print_status(Status.WARN, f"{label} (already exists, use --force to overwrite)", out)
+            skipped += 1
+    return installed, skipped, unchanged
+
+
+_settings_cache = None
+
+
 def load_settings():
-    """Load existing settings.json or return empty dict."""
+    """Load existing settings.json or return empty dict.
+
+    The file is read once per run; later calls return the same dict.
+    """
+    global _settings_cache
+    if _settings_cache is not None:
+        return _settings_cache
     settings_path = get_settings_path()
+    _settings_cache = {}
     if settings_path.exists():
         try:
             with open(settings_path, 'r') as f:
-                return json.load(f)
+                _settings_cache = json.load(f)
         except (json.JSONDecodeError, IOError):
-            return {}
-    return {}
+            pass
+    return _settings_cache
 
 
 def save_settings(settings):
-    """Save settings to settings.json."""
-    settings_path = get_settings_path()
-    settings_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(settings_path, 'w') as f:
-        json.dump(settings, f, indent=2)
+    """Save settings to settings.json.
+
+    Writes to a temp file in the same directory and renames it over the
+    original, so settings.json is never left half-written.
+    """
+    import tempfile
+
+    global _settings_cache
+    _settings_cache = settings
+    # Write through a symlinked settings.json (e.g. one managed by stow)
+    # rather than replacing the link itself
+    target = get_settings_path().resolve()
+    target.parent.mkdir(parents=True, exist_ok=True)
+    f = tempfile.NamedTemporaryFile(
+        'w', dir=target.parent, prefix=".settings.", suffix=".tmp", delete=False
+    )
+    try:
+        with f:
+            json.dump(settings, f, indent=2)
+        if target.exists():
+            shutil.copymode(target, f.name)
+        else:
+            # NamedTemporaryFile creates 0600; match what open() would give
+            umask = os.umask(0)
+            os.umask(umask)
+            os.chmod(f.name, 0o666 & ~umask)
+        os.replace(f.name, target)
+    except BaseException:
+        try:
+            os.unlink(f.name)
+        except OSError:
+            pass
+        raise
 
 
 def check_mcp_servers():
@@ -204,7 +581,7 @@ def check_mcp_servers():
     mcp_servers = settings.get("mcpServers", {})
 
     configured = []
-    for server_id, server_info in MCP_SERVERS.items():
+    for server_id, server_info in get_mcp_servers().items():
         if server_id in mcp_servers:
             env = mcp_servers[server_id].get("env", {})
             api_key = env.get(server_info["env_var"], "")
@@ -227,37 +604,40 @@ def configure_mcp_servers(api_keys=None):
     # If api_keys provided (non-interactive), use those
     if api_keys:
         for server_id, api_key in api_keys.items():
-            if server_id in MCP_SERVERS and api_key:
-                server_info = MCP_SERVERS[server_id]
+            if server_id in get_mcp_servers() and api_key:
+                server_info = get_mcp_servers()[server_id]
                 config = server_info["config"].copy()
                 config["env"] = {server_info["env_var"]: api_key}
                 settings["mcpServers"][server_id] = config
-                print_status("ok", f"Configured {server_info['name']}")
+                print_status(Status.OK, f"Configured {server_info['name']}")
         save_settings(settings)
         return True
 
-    # Interactive configuration
-    print("\n  Available MCP search servers:\n")
-
-    servers_list = list(MCP_SERVERS.items())
-    for i, (server_id, server_info) in enumerate(servers_list, 1):
-        existing = server_id in settings["mcpServers"]
-        status = " (configured)" if existing else ""
-        print(f"    {i}. {server_info['name']}: {server_info['description']}{status}")
-        print(f"       Get API key: {server_info['url']}")
-        print()
-
-    print("    0. Skip MCP configuration")
-    print()
-
+    # Interactive configuration; settings are written once, after the loop
+    servers_list = list(get_mcp_servers().items())
+    configured = False
     try:
-        choice = input("  Select server to configure (0-4): ").strip()
-        if choice == "0" or not choice:
-            print_status("info", "Skipping MCP configuration")
-            return False
+        while True:
+            print("\n  Available MCP search servers:\n")
+            for i, (server_id, server_info) in enumerate(servers_list, 1):
+                existing = server_id in settings["mcpServers"]
+                status = " (configured)" if existing else ""
+                print(f"    {i}. {server_info['name']}: {server_info['description']}{status}")
+                print(f"       Get API key: {server_info['url']}")
+                print()
+
+            print("    0. Skip MCP configuration")
+            print()
+
+            choice = input(f"  Select server to configure (0-{len(servers_list)}): ").strip()
+            if choice == "0" or not choice:
+                print_status(Status.INFO, "Skipping MCP configuration")
+                break
 
-        idx = int(choice) - 1
-        if 0 <= idx < len(servers_list):
+            idx = int(choice) - 1
+            if not 0 <= idx < len(servers_list):
+                print_status(Status.ERROR, "Invalid selection")
+                break
             server_id, server_info = servers_list[idx]
 
             print(f"\n  Configuring {server_info['name']}...")
@@ -265,263 +645,291 @@ def configure_mcp_servers(api_keys=None):
             print()
 
             api_key = input(f"  Enter {server_info['env_var']}: ").strip()
+            if not api_key:
+                print_status(Status.WARN, "No API key provided, skipping")
+                break
+
+            config = server_info["config"].copy()
+            config["env"] = {server_info["env_var"]: api_key}
+            settings["mcpServers"][server_id] = config
+            configured = True
+            print_status(Status.OK, f"Configured {server_info['name']}")
+
+            # Ask if user wants to configure more
+            another = input("\n  Configure another server? (y/n): ").strip().lower()
+            if another != 'y':
+                break
+
+    except (ValueError, KeyboardInterrupt, EOFError):
+        print()
+        print_status(Status.INFO, "Configuration cancelled")
 
-            if api_key:
-                config = server_info["config"].copy()
-                config["env"] = {server_info["env_var"]: api_key}
-                settings["mcpServers"][server_id] = config
-                save_settings(settings)
-                print_status("ok", f"Configured {server_info['name']}")
-
-                # Ask if user wants to configure more
-                another = input("\n  Configure another server? (y/n): ").strip().lower()
-                if another == 'y':
-                    return configure_mcp_servers()
-                return True
-            else:
-                print_status("warn", "No API key provided, skipping")
-                return False
-        else:
-            print_status("error", "Invalid selection")
-            return False
+    # Keep servers configured before a cancel or a skipped follow-up
+    if configured:
+        save_settings(settings)
+    return configured
 
-    except (ValueError, KeyboardInterrupt):
-        print()
-        print_status("info", "Configuration cancelled")
-        return False
+
+def scan_dir(path):
+    """Map entry names to DirEntry objects for a directory, empty if missing."""
+    try:
+        with os.scandir(path) as entries:
+            return {entry.name: entry for entry in entries}
+    except OSError:
+        return {}
+
+
+# Below this many directories, thread startup costs more than the scans
+_PARALLEL_SCAN_MIN = 32
+
+
+def scan_dirs(paths):
+    """Scan independent directories, keyed by path.
+
+    Each scan is a single readdir. Large batches run in parallel to hide
+    per-call latency on network filesystems; a handful of local directories
+    is quicker to scan in turn.
+    """
+    paths = list(dict.fromkeys(paths))
+    if len(paths) < _PARALLEL_SCAN_MIN:
+        return {path: scan_dir(path) for path in paths}
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=min(8, len(paths))) as executor:
+        return dict(zip(paths, executor.map(scan_dir, paths)))
+
+
+def find_missing_components():
+    """Return the labels of skills, skill files and agents not installed."""
+    skills_dir = get_skills_dir()
+    agents_dir = get_agents_dir()
+
+    # One scandir per directory instead of a stat per component
+    skill_files = [skills_dir / file for file in SKILL_FILES]
+    agent_files = [agents_dir / agent for agent in AGENT_FILES]
+    listings = scan_dirs(
+        [skills_dir, agents_dir]
+        + [skills_dir / skill for skill in SKILL_DIRS]
+        + [path.parent for path in skill_files + agent_files]
+    )
+    installed_skills = listings[skills_dir]
+
+    missing = []
+    for skill in SKILL_DIRS:
+        entry = installed_skills.get(skill)
+        if not (entry and entry.is_dir() and "SKILL.md" in listings[skills_dir / skill]):
+            missing.append(f"/{skill}")
+    for label, path in zip(SKILL_FILES + AGENT_FILES, skill_files + agent_files):
+        if path.name not in listings[path.parent]:
+            missing.append(label)
+    return missing
 
 
 def check_installation():
-    """Check current installation status."""
-    print_header("Installation Status Check")
+    """Check current installation status.
+
+    Returns (yaml_ok, missing), where missing lists uninstalled components.
+    """
+    out = []
+    print_header("Installation Status Check", out)
 
     skills_dir = get_skills_dir()
     agents_dir = get_agents_dir()
     settings_path = get_settings_path()
 
-    print(f"\n  Skills directory: {skills_dir}")
-    print(f"  Agents directory: {agents_dir}")
-    print(f"  Settings file: {settings_path}")
+    out.append(f"\n  Skills directory: {skills_dir}")
+    out.append(f"  Agents directory: {agents_dir}")
+    out.append(f"  Settings file: {settings_path}")
 
-    print("\n  Skills:")
-    for skill in SKILL_DIRS:
-        skill_path = skills_dir / skill / "SKILL.md"
-        if skill_path.exists():
-            print_status("ok", f"/{skill}")
-        else:
-            print_status("error", f"/{skill} (not installed)")
+    missing = set(find_missing_components())
 
-    for file in SKILL_FILES:
-        file_path = skills_dir / file
-        if file_path.exists():
-            print_status("ok", file)
+    out.append("\n  Skills:")
+    for label in [f"/{skill}" for skill in SKILL_DIRS] + SKILL_FILES:
+        if label in missing:
+            print_status(Status.ERROR, f"{label} (not installed)", out)
         else:
-            print_status("error", f"{file} (not installed)")
+            print_status(Status.OK, label, out)
 
-    print("\n  Agents:")
+    out.append("\n  Agents:")
     for agent in AGENT_FILES:
-        agent_path = agents_dir / agent
-        if agent_path.exists():
-            print_status("ok", agent)
+        if agent in missing:
+            print_status(Status.ERROR, f"{agent} (not installed)", out)
         else:
-            print_status("error", f"{agent} (not installed)")
+            print_status(Status.OK, agent, out)
 
-    print("\n  MCP Servers:")
+    out.append("\n  MCP Servers:")
     configured, mcp_servers = check_mcp_servers()
     if configured:
         for server_id, name, has_key in configured:
             if has_key:
-                print_status("ok", f"{name}")
+                print_status(Status.OK, f"{name}", out)
             else:
-                print_status("warn", f"{name} (no API key)")
+                print_status(Status.WARN, f"{name} (no API key)", out)
 
     # Check for servers not in our list but configured
     for server_id in mcp_servers:
-        if server_id not in MCP_SERVERS:
-            print_status("ok", f"{server_id} (custom)")
+        if server_id not in get_mcp_servers():
+            print_status(Status.OK, f"{server_id} (custom)", out)
 
     if not mcp_servers:
-        print_status("error", "No MCP servers configured")
-        print_status("info", "Run: python install.py --mcp")
+        print_status(Status.ERROR, "No MCP servers configured", out)
+        print_status(Status.INFO, "Run: python install.py --mcp", out)
 
-    print("\n  Dependencies:")
+    out.append("\n  Dependencies:")
     yaml_ok, version = check_pyyaml()
     if yaml_ok:
-        print_status("ok", f"PyYAML {version}")
+        import yaml  # already loaded by check_pyyaml; no second import cost
+        backend = "libyaml" if getattr(yaml, "__with_libyaml__", False) else "pure Python"
+        print_status(Status.OK, f"PyYAML {version} ({backend})", out)
     else:
-        print_status("error", "PyYAML (not installed)")
+        print_status(Status.ERROR, "PyYAML (not installed)", out)
 
-    return yaml_ok
+    flush_output(out)
+    return yaml_ok, sorted(missing)
 
 
-def install(force=False, skip_mcp=False):
+def install(force=False, skip_mcp=False, quiet=False):
     """Install all components."""
-    print_header("Deep Research System Installer")
+    import platform
 
-    print(f"\n  Platform: {platform.system()} {platform.release()}")
-    print(f"  Python: {sys.version.split()[0]}")
+    # Nothing to do if every component and PyYAML are already in place
+    if not force and check_pyyaml()[0] and not find_missing_components():
+        print_status(Status.OK, "All components installed (use --force to reinstall)")
+        return True
+
+    # Output is buffered per phase and written with one call at phase end
+    out = []
+    print_header("Deep Research System Installer", out)
+
+    out.append(f"\n  Platform: {platform.system()} {platform.release()}")
+    out.append(f"  Python: {sys.version.split()[0]}")
 
     # Check source files exist
     if not SRC_DIR.exists():
-        print_status("error", f"Source directory not found: {SRC_DIR}")
-        print_status("info", "Please run this script from the project root directory.")
+        print_status(Status.ERROR, f"Source directory not found: {SRC_DIR}", out)
+        print_status(Status.INFO, "Please run this script from the project root directory.", out)
+        flush_output(out)
         return False
 
     skills_dir = get_skills_dir()
     agents_dir = get_agents_dir()
 
-    print(f"\n  Installing to:")
-    print(f"    Skills: {skills_dir}")
-    print(f"    Agents: {agents_dir}")
+    out.append(f"\n  Installing to:")
+    out.append(f"    Skills: {skills_dir}")
+    out.append(f"    Agents: {agents_dir}")
 
     # Create directories
-    print_header("Creating Directories")
+    print_header("Creating Directories", out)
     skills_dir.mkdir(parents=True, exist_ok=True)
-    print_status("ok", f"Created {skills_dir}")
+    print_status(Status.OK, f"Created {skills_dir}", out)
     agents_dir.mkdir(parents=True, exist_ok=True)
-    print_status("ok", f"Created {agents_dir}")
+    print_status(Status.OK, f"Created {agents_dir}", out)
+    flush_output(out)
+
+    # Copy everything up front; destinations are disjoint, so the copies can
+    # run concurrently. Skill files live inside skill directories, so they are
+    # copied in a second wave once their parent directory is in place.
+    skill_tasks = [
+        (f"/{skill}", SRC_SKILLS_DIR / skill, skills_dir / skill, True)
+        for skill in SKILL_DIRS
+    ]
+    skill_file_tasks = [
+        (file, SRC_SKILLS_DIR / file, skills_dir / file, False)
+        for file in SKILL_FILES
+    ]
+    agent_tasks = [
+        (agent, SRC_AGENTS_DIR / agent, agents_dir / agent, False)
+        for agent in AGENT_FILES
+    ]
+    first_wave = run_copy_tasks(skill_tasks + agent_tasks, force)
+    skill_results = first_wave[:len(skill_tasks)]
+    skill_results += run_copy_tasks(skill_file_tasks, force)
+    agent_results = first_wave[len(skill_tasks):]
 
     # Install skills
-    print_header("Installing Skills")
-    skills_installed = 0
-    skills_skipped = 0
-
-    for skill in SKILL_DIRS:
-        src = SRC_SKILLS_DIR / skill
-        dst = skills_dir / skill
-        if src.exists():
-            success, status = copy_directory(src, dst, force)
-            if success:
-                print_status("ok", f"/{skill}")
-                skills_installed += 1
-            else:
-                if force:
-                    print_status("error", f"/{skill} (failed)")
-                else:
-                    print_status("warn", f"/{skill} (already exists, use --force to overwrite)")
-                    skills_skipped += 1
-        else:
-            print_status("error", f"/{skill} (source not found)")
-
-    for file in SKILL_FILES:
-        src = SRC_SKILLS_DIR / file
-        dst = skills_dir / file
-        if src.exists():
-            success, status = copy_file(src, dst, force)
-            if success:
-                print_status("ok", file)
-                skills_installed += 1
-            else:
-                if force:
-                    print_status("error", f"{file} (failed)")
-                else:
-                    print_status("warn", f"{file} (already exists, use --force to overwrite)")
-                    skills_skipped += 1
-        else:
-            print_status("error", f"{file} (source not found)")
+    print_header("Installing Skills", out)
+    skills_installed, skills_skipped, skills_unchanged = report_copy_results(
+        skill_tasks + skill_file_tasks, skill_results, out
+    )
 
     # Install agents
-    print_header("Installing Agents")
-    agents_installed = 0
-    agents_skipped = 0
-
-    for agent in AGENT_FILES:
-        src = SRC_AGENTS_DIR / agent
-        dst = agents_dir / agent
-        if src.exists():
-            success, status = copy_file(src, dst, force)
-            if success:
-                print_status("ok", agent)
-                agents_installed += 1
-            else:
-                if force:
-                    print_status("error", f"{agent} (failed)")
-                else:
-                    print_status("warn", f"{agent} (already exists, use --force to overwrite)")
-                    agents_skipped += 1
-        else:
-            print_status("error", f"{agent} (source not found)")
+    print_header("Installing Agents", out)
+    agents_installed, agents_skipped, agents_unchanged = report_copy_results(
+        agent_tasks, agent_results, out
+    )
+    flush_output(out)
 
     # Check/install PyYAML
-    print_header("Checking Dependencies")
+    print_header("Checking Dependencies", out)
     yaml_ok, version = check_pyyaml()
     if yaml_ok:
-        print_status("ok", f"PyYAML {version} (already installed)")
+        print_status(Status.OK, f"PyYAML {version} (already installed)", out)
     else:
+        flush_output(out)
         if install_pyyaml():
             yaml_ok, version = check_pyyaml()
             if yaml_ok:
-                print_status("ok", f"PyYAML {version} (installed)")
+                print_status(Status.OK, f"PyYAML {version} (installed)", out)
             else:
-                print_status("error", "PyYAML installation verification failed")
+                print_status(Status.ERROR, "PyYAML installation verification failed", out)
         else:
-            print_status("error", "PyYAML (please install manually: pip install PyYAML)")
+            print_status(Status.ERROR, "PyYAML (please install manually: pip install PyYAML)", out)
 
     # Summary
-    print_header("Installation Summary")
+    print_header("Installation Summary", out)
     total_installed = skills_installed + agents_installed
     total_skipped = skills_skipped + agents_skipped
+    total_unchanged = skills_unchanged + agents_unchanged
 
     if total_installed > 0:
-        print_status("ok", f"Installed: {total_installed} components")
+        print_status(Status.OK, f"Installed: {total_installed} components", out)
+    if total_unchanged > 0:
+        print_status(Status.OK, f"Unchanged: {total_unchanged} components (already up to date)", out)
     if total_skipped > 0:
-        print_status("warn", f"Skipped: {total_skipped} components (already exist)")
+        print_status(Status.WARN, f"Skipped: {total_skipped} components (already exist)", out)
     if yaml_ok:
-        print_status("ok", "Dependencies: satisfied")
+        print_status(Status.OK, "Dependencies: satisfied", out)
     else:
-        print_status("error", "Dependencies: PyYAML missing")
+        print_status(Status.ERROR, "Dependencies: PyYAML missing", out)
+
+    # Help text is only worth showing when something new was installed
+    show_help = not quiet and total_installed > 0
 
     # Check MCP servers
     configured, mcp_servers = check_mcp_servers()
     has_valid_mcp = any(has_key for _, _, has_key in configured)
 
     if has_valid_mcp:
-        print_status("ok", f"MCP Servers: {len([c for c in configured if c[2]])} configured")
+        print_status(Status.OK, f"MCP Servers: {len([c for c in configured if c[2]])} configured", out)
     else:
-        print_status("warn", "MCP Servers: none configured")
+        print_status(Status.WARN, "MCP Servers: none configured", out)
+        if not show_help:
+            print_status(Status.INFO, "Run: python install.py --mcp", out)
 
     # MCP server configuration
-    if not skip_mcp and not has_valid_mcp:
-        print_header("MCP Server Setup")
-        print("""
-  Web search requires at least one MCP search server.
-  You can configure this now or later with: python install.py --mcp
-""")
+    if show_help and not skip_mcp and not has_valid_mcp:
+        print_header("MCP Server Setup", out)
+        out.append(MCP_SETUP_TEXT)
+        flush_output(out)
         try:
             setup_now = input("  Configure MCP server now? (y/n): ").strip().lower()
             if setup_now == 'y':
                 configure_mcp_servers()
         except (KeyboardInterrupt, EOFError):
-            print()
-            print_status("info", "Skipping MCP configuration")
+            out.append("")
+            print_status(Status.INFO, "Skipping MCP configuration", out)
 
     # Usage instructions
-    print_header("Usage")
-    print("""
-  Available commands:
-
-    /research <topic>           Generate research outline
-    /research-add-items         Add items to existing outline
-    /research-add-fields        Add fields to existing definitions
-    /research-deep              Execute deep research on outline
-    /research-report            Generate markdown report from results
-    /research-auto <topic>      Run complete research workflow
-
-  Autonomous mode (no prompts):
+    if show_help:
+        print_header("Usage", out)
+        out.append(USAGE_TEXT)
 
-    /research <topic> --auto
-    /research-auto <topic> --auto
-
-  Example:
-
-    /research-auto "AI chip market 2024-2025" --auto
-""")
+    flush_output(out)
+    return yaml_ok and total_installed + total_unchanged > 0
 
-    return yaml_ok and total_installed > 0
 
-
-def main():
-    """Main entry point."""
+def build_parser():
+    """Build the command-line argument parser."""
     import argparse
 
     parser = argparse.ArgumentParser(
@@ -533,6 +941,7 @@ Examples:
   python install.py --force   # Overwrite existing files
   python install.py --check   # Check installation status
   python install.py --mcp     # Configure MCP search servers
+  python install.py --quiet   # Install without prompts or usage help (CI)
 
   # Configure specific MCP servers non-interactively:
   python install.py --tavily-key YOUR_KEY
@@ -580,8 +989,25 @@ Examples:
         action="store_true",
         help="Skip MCP server configuration prompt"
     )
+    parser.add_argument(
+        "--quiet", "-q",
+        action="store_true",
+        help="Skip the MCP setup prompt and usage help (for CI)"
+    )
+
+    return parser
+
+
+def main(argv=None):
+    """Main entry point."""
+    argv = sys.argv[1:] if argv is None else argv
+
+    # A bare --check never needs the full parser
+    if argv in (["--check"], ["-c"]):
+        check_installation()
+        return
 
-    args = parser.parse_args()
+    args = build_parser().parse_args(argv)
 
     # Collect API keys from arguments
     api_keys = {}
@@ -603,14 +1029,14 @@ Examples:
             configure_mcp_servers()
     elif api_keys:
         # If API keys provided, install everything including MCP
-        success = install(force=args.force, skip_mcp=True)
+        success = install(force=args.force, skip_mcp=True, quiet=args.quiet)
         if success:
             configure_mcp_servers(api_keys)
         if not success:
             sys.exit(1)
         print("\n  Installation complete!\n")
     else:
-        success = install(force=args.force, skip_mcp=args.skip_mcp)
+        success = install(force=args.force, skip_mcp=args.skip_mcp, quiet=args.quiet)
         if not success:
             sys.exit(1)
         print("\n  Installation complete!\n")
@@ -12,6 +12,7 @@
 #   ./install.sh --perplexity-key KEY   # Configure Perplexity with API key
 #   ./install.sh --firecrawl-key KEY    # Configure Firecrawl with API key
 #   ./install.sh --skip-mcp             # Skip MCP configuration prompt
+#   ./install.sh --quiet                # Skip MCP prompt and usage help (CI)
 #
 # Examples:
 #   ./install.sh --force --tavily-key tvly-xxxxx
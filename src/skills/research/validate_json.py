@@ -1,13 +1,27 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
+import functools
 import json
+import mmap
+import os
+import stat
 import sys
 from collections import defaultdict
 from pathlib import Path
 
 import yaml
 
+try:
+    from orjson import JSONDecodeError as _OrjsonDecodeError, loads as _orjson_loads
+except ImportError:
+    _orjson_loads = None
+
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 CATEGORY_MAPPING = {
     "basic_info": ["basic_info", "Basic Info"],
     "technical_features": ["technical_features", "technical_characteristics", "Technical Features"],
@@ -19,93 +33,195 @@ CATEGORY_MAPPING = {
     "market_positioning": ["market_positioning", "market", "Market Positioning"],
 }
 
-_SKIP_KEYS = {"_source_file", "uncertain"}
+
+def _intern(value):
+    # Interned names let set lookups succeed on identity before comparing strings
+    return sys.intern(value) if type(value) is str else value
+
+
+_SKIP_KEYS = frozenset(map(_intern, ("_source_file", "uncertain")))
+_NESTED_KEYS = frozenset(_intern(k) for keys in CATEGORY_MAPPING.values() for k in keys)
+# Below this many files (or on one CPU), process pool startup costs more than it saves
+_PARALLEL_MIN_FILES = 8
+_worker_args = None
+_DECODER = json.JSONDecoder()
+
+
+def _json_loads(buf):
+    if _orjson_loads is not None:
+        try:
+            return _orjson_loads(buf)
+        except _OrjsonDecodeError:
+            # orjson is stricter than json (no NaN/Infinity); let json decide
+            pass
+    return _DECODER.decode(str(buf, "utf-8"))
+
+
+def _load_json(json_path):
+    with open(json_path, "rb") as f:
+        st = os.fstat(f.fileno())
+        # Pipes, FIFOs and empty files can't be mapped; read them normally
+        if not stat.S_ISREG(st.st_mode) or st.st_size == 0:
+            return _json_loads(f.read())
+        # Parse straight from a read-only mapping, without a bytes copy of the file
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+            return _json_loads(view)
 
 
 def load_fields_yaml(fields_path):
-    with fields_path.open(encoding="utf-8") as f:
-        data = yaml.safe_load(f)
+    fields_path = Path(fields_path)
+    return _load_fields_yaml(str(fields_path), fields_path.stat().st_mtime_ns)
+
+
+@functools.lru_cache(maxsize=None)
+def _load_fields_yaml(fields_path, mtime_ns):
+    with open(fields_path, encoding="utf-8") as f:
+        data = yaml.load(f, Loader=_YamlLoader)
     items = [
-        (field["name"], category["category"], field.get("required", False))
+        (_intern(field["name"]), _intern(category["category"]), field.get("required", False))
         for category in data.get("field_categories", [])
         for field in category.get("fields", [])
     ]
-    all_fields = {name for name, _, _ in items}
-    required_fields = {name for name, _, required in items if required}
+    all_fields = frozenset(name for name, _, _ in items)
+    required_fields = frozenset(name for name, _, required in items if required)
     field_categories = {name: category for name, category, _ in items}
-    return all_fields, required_fields, field_categories
+    category_fields = defaultdict(set)
+    for name, category in field_categories.items():
+        category_fields[category].add(name)
+    cat_to_fields = {category: frozenset(names) for category, names in category_fields.items()}
+    return all_fields, required_fields, field_categories, cat_to_fields
 
 
-def extract_json_fields(data, category_mapping=None):
-    category_mapping = CATEGORY_MAPPING if category_mapping is None else category_mapping
-    nested_keys = {k for keys in category_mapping.values() for k in keys}
-    fields = set()
-    stack = [(data, True)]
+def _walk_fields(root, nested_keys, fields):
+    stack = [(root, True)]
+    push, pop, add = stack.append, stack.pop, fields.add
+    skip = _SKIP_KEYS
     while stack:
-        obj, is_category_level = stack.pop()
-        if isinstance(obj, dict):
+        obj, is_category_level = pop()
+        # JSON decoding only yields plain dicts and lists, so exact type checks suffice
+        if type(obj) is dict:
             for k, v in obj.items():
-                if k in _SKIP_KEYS:
+                if k in skip:
                     continue
                 if is_category_level and k in nested_keys:
-                    if isinstance(v, dict):
-                        stack.append((v, True))
+                    if type(v) is dict:
+                        push((v, True))
                     continue
-                fields.add(k)
-        elif isinstance(obj, list):
-            stack.extend((item, is_category_level) for item in obj if isinstance(item, dict))
+                add(k)
+        elif type(obj) is list:
+            for item in obj:
+                if type(item) is dict:
+                    push((item, is_category_level))
+    return fields
+
+
+def extract_json_fields(data, category_mapping=None):
+    nested_keys = (
+        _NESTED_KEYS
+        if category_mapping is None
+        else {k for keys in category_mapping.values() for k in keys}
+    )
+    if type(data) is not dict:
+        return _walk_fields(data, nested_keys, set())
+    # Fast path for the usual {category: {field: ...}} shape; only categories
+    # nested inside categories need the general walk.
+    fields = set()
+    skip = _SKIP_KEYS
+    for k, v in data.items():
+        if k in skip:
+            continue
+        if k not in nested_keys:
+            fields.add(k)
+        elif type(v) is dict:
+            if nested_keys.isdisjoint(v):
+                fields.update(v.keys() - skip)
+            else:
+                _walk_fields(v, nested_keys, fields)
     return fields
 
 
-def validate_json(json_path, all_fields, required_fields, field_categories):
-    with json_path.open(encoding="utf-8") as f:
-        data = json.load(f)
+def validate_json(json_path, all_fields, required_fields, cat_to_fields, quiet=False):
+    data = _load_json(json_path)
     json_fields = extract_json_fields(data)
     covered = all_fields & json_fields
     missing = all_fields - json_fields
-    extra = json_fields - all_fields
     missing_required = missing & required_fields
-    missing_by_category = defaultdict(list)
-    for field in missing:
-        missing_by_category[field_categories.get(field, "Unknown")].append(field)
+    coverage_rate = len(covered) / len(all_fields) * 100 if all_fields else 100
+    if quiet and not missing_required:
+        # A quiet pass only reports coverage, so skip the per-field breakdown
+        return {
+            "file": json_path.name,
+            "total_defined": len(all_fields),
+            "covered": len(covered),
+            "coverage_rate": coverage_rate,
+            "missing_required": [],
+            "valid": True,
+        }
+    extra = json_fields - all_fields
+    missing_optional = missing - required_fields
+    optional_by_category = {
+        cat: fs & missing_optional for cat, fs in cat_to_fields.items() if not fs.isdisjoint(missing_optional)
+    }
     return {
         "file": json_path.name,
         "total_defined": len(all_fields),
         "covered": len(covered),
         "missing": len(missing),
         "extra": len(extra),
-        "coverage_rate": len(covered) / len(all_fields) * 100 if all_fields else 100,
+        "coverage_rate": coverage_rate,
         "missing_required": sorted(missing_required),
-        "missing_optional": sorted(missing - required_fields),
-        "missing_by_category": {k: sorted(v) for k, v in missing_by_category.items()},
+        "missing_optional": sorted(missing_optional),
+        "missing_optional_by_category": {k: sorted(v) for k, v in optional_by_category.items()},
         "extra_fields": sorted(extra),
         "valid": len(missing_required) == 0,
     }
 
 
+def _init_worker(all_fields, required_fields, cat_to_fields, quiet):
+    global _worker_args
+    _worker_args = (all_fields, required_fields, cat_to_fields, quiet)
+
+
+def _validate_worker(json_path):
+    return validate_json(json_path, *_worker_args)
+
+
+_RULE = "=" * 60
+
+
 def print_result(result, verbose=True):
     status = "PASS" if result["valid"] else "FAIL"
-    line = "=" * 60
-    print(f"\n{line}")
-    print(f"[{status}] {result['file']}")
-    print(line)
-    print(f"Coverage: {result['coverage_rate']:.1f}% ({result['covered']}/{result['total_defined']})")
-    if result["missing_required"]:
-        print(f"\n[ERROR] Missing required fields ({len(result['missing_required'])}):")
-        print("\n".join(f"  - {f}" for f in result["missing_required"]))
+    parts = [
+        f"\n{_RULE}\n",
+        f"[{status}] {result['file']}\n",
+        f"{_RULE}\n",
+        f"Coverage: {result['coverage_rate']:.1f}% ({result['covered']}/{result['total_defined']})\n",
+    ]
+    missing_required = result["missing_required"]
+    if missing_required:
+        parts.append(f"\n[ERROR] Missing required fields ({len(missing_required)}):\n")
+        parts.extend(f"  - {f}\n" for f in missing_required)
     if verbose and result["missing_optional"]:
-        missing_required = set(result["missing_required"])
-        print(f"\n[WARN] Missing optional fields ({len(result['missing_optional'])}):")
-        for cat in sorted(result["missing_by_category"]):
-            optional = [f for f in result["missing_by_category"][cat] if f not in missing_required]
-            if optional:
-                print(f"  [{cat}]: {', '.join(optional)}")
+        parts.append(f"\n[WARN] Missing optional fields ({len(result['missing_optional'])}):\n")
+        optional_by_category = result["missing_optional_by_category"]
+        for cat in sorted(optional_by_category):
+            parts.append(f"  [{cat}]: {', '.join(optional_by_category[cat])}\n")
     if verbose and result["extra_fields"]:
         extra = result["extra_fields"]
-        print(f"\n[INFO] Extra fields ({len(extra)}):")
-        print(f"  {', '.join(extra[:10])}")
+        parts.append(f"\n[INFO] Extra fields ({len(extra)}):\n")
+        parts.append(f"  {', '.join(extra[:10])}\n")
         if len(extra) > 10:
-            print(f"  ... and {len(extra) - 10} more")
+            parts.append(f"  ... and {len(extra) - 10} more\n")
+    sys.stdout.write("".join(parts))
+
+
+def _list_json_files(directory):
+    try:
+        with os.scandir(directory) as it:
+            paths = [Path(e.path) for e in it if e.name.endswith(".json") and e.is_file()]
+    except OSError:
+        return []
+    return sorted(paths, key=lambda p: p.name)
 
 
 def main():
@@ -126,28 +242,33 @@ def main():
         print(f"[ERROR] fields.yaml not found: {fields_path}")
         sys.exit(1)
     print(f"Field definition file: {fields_path}")
-    all_fields, required_fields, field_categories = load_fields_yaml(fields_path)
+    all_fields, required_fields, _, cat_to_fields = load_fields_yaml(fields_path)
     print(f"Total fields: {len(all_fields)} (required: {len(required_fields)}, optional: {len(all_fields) - len(required_fields)})")
-    json_files = (
-        [Path(p) for p in args.json]
-        if args.json
-        else sorted(Path(args.dir).glob("*.json")) if Path(args.dir).exists() else []
-    )
+    json_files = [Path(p) for p in args.json] if args.json else _list_json_files(args.dir)
     if not json_files:
         print("[WARN] No JSON files found")
         sys.exit(0)
+    validate_args = (all_fields, required_fields, cat_to_fields, args.quiet)
+    existing = [p for p in json_files if p.exists()]
+    if len(existing) >= _PARALLEL_MIN_FILES and (os.cpu_count() or 1) > 1:
+        # Imported here: multiprocessing is costly to load for single-file runs
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(initializer=_init_worker, initargs=validate_args) as ex:
+            validated = dict(zip(existing, ex.map(_validate_worker, existing, chunksize=4)))
+    else:
+        validated = {p: validate_json(p, *validate_args) for p in existing}
     results = []
     for json_path in json_files:
-        if not json_path.exists():
+        result = validated.get(json_path)
+        if result is None:
             print(f"[WARN] File not found: {json_path}")
             continue
-        result = validate_json(json_path, all_fields, required_fields, field_categories)
         results.append(result)
         print_result(result, verbose=not args.quiet)
-    line = "=" * 60
-    print(f"\n{line}")
+    print(f"\n{_RULE}")
     print("Summary")
-    print(line)
+    print(_RULE)
     passed = sum(1 for r in results if r["valid"])
     avg_coverage = sum(r["coverage_rate"] for r in results) / len(results) if results else 0
     print(f"Validation passed: {passed}/{len(results)}")